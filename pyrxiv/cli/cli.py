@@ -1,5 +1,8 @@
+import multiprocessing
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,13 +14,16 @@ if TYPE_CHECKING:
     from pyrxiv.datamodel import ArxivPaper
 
 
+from pyrxiv.datamodel import TEXT_COMPRESSIONS, get_text_compression
 from pyrxiv.download import ArxivDownloader
-from pyrxiv.extract import TextExtractor
+from pyrxiv.extract import AVAILABLE_LOADERS, TextExtractor
 from pyrxiv.fetch import ArxivFetcher
 from pyrxiv.logger import logger
 
 
-def save_paper_to_hdf5(paper: "ArxivPaper", pdf_path: Path, hdf_path: Path) -> None:
+def save_paper_to_hdf5(
+    paper: "ArxivPaper", pdf_path: Path, hdf_path: Path, compression: str = "gzip"
+) -> None:
     """
     Saves the arXiv paper metadata to an HDF5 file.
 
@@ -25,9 +31,10 @@ def save_paper_to_hdf5(paper: "ArxivPaper", pdf_path: Path, hdf_path: Path) -> N
         paper (ArxivPaper): The arXiv paper object containing metadata.
         pdf_path (Path): The path to the PDF file of the arXiv paper.
         hdf_path (Path): The path to the HDF5 file where the metadata will be saved.
+        compression (str, optional): The compression codec of the text dataset. Defaults to "gzip".
     """
     with h5py.File(hdf_path, "a") as h5f:
-        group = paper.to_hdf5(hdf_file=h5f)
+        group = paper.to_hdf5(hdf_file=h5f, compression=compression)
         # Store PDF in the HDF5 file
         with open(pdf_path, "rb") as f:
             pdf_bytes = f.read()
@@ -37,6 +44,39 @@ def save_paper_to_hdf5(paper: "ArxivPaper", pdf_path: Path, hdf_path: Path) -> N
         group.create_dataset("pdf", data=np.void(pdf_bytes))
 
 
+def _extract_text(
+    pdf_path: Path | None,
+    loader: str,
+    clean_text: bool,
+    regex: re.Pattern | None,
+) -> str | None:
+    """
+    Extracts the text from the PDF file, optionally cleans it, and filters it with the `regex` pattern. This
+    function is defined at module level so it can be pickled and run in the worker processes of a `ProcessPoolExecutor`,
+    so the text of the papers not matching the pattern is discarded in the workers.
+
+    Args:
+        pdf_path (Path | None): The path to the PDF file.
+        loader (str): The loader to use for extracting text from the PDF file.
+        clean_text (bool): If True, the extracted text will be cleaned by removing references and unnecessary whitespaces.
+        regex (re.Pattern | None): If specified, the text has to match this pattern.
+
+    Returns:
+        str | None: The extracted text from the PDF file. It is an empty string if no text could be extracted,
+            and None if the text does not match the `regex` pattern.
+    """
+    extractor = TextExtractor()
+    text = extractor.get_text(pdf_path=pdf_path, loader=loader)
+    if not text:
+        return ""
+    if clean_text:
+        text = extractor.delete_references(text=text)
+        text = extractor.clean_text(text=text)
+    if regex and not regex.search(text):
+        return None
+    return text
+
+
 def run_search_and_download(
     download_path: Path = Path("data"),
     category: str = "cond-mat.str-el",
@@ -44,8 +84,10 @@ def run_search_and_download(
     regex_pattern: str = "",
     start_id: str | None = None,
     start_from_filepath: bool = False,
-    loader: str = "pdfminer",
+    loader: str = "pypdfium2",
     clean_text: bool = True,
+    n_workers: int = 8,
+    compression: str = "gzip",
 ) -> tuple[list[Path], list["ArxivPaper"]]:
     """
     Searches for a specific number of papers `n_papers` in arXiv for a specified `category` and downloads
@@ -68,81 +110,122 @@ def run_search_and_download(
         start_from_filepath (bool, optional): If True, the search will start from the last downloaded arXiv ID. Otherwise, it will start from the
             newest papers in the `category`. Defaults to False.
         loader (str, optional): PDF loader to use for extracting text from the downloaded PDFs.
-            Defaults to "pdfminer". Available loaders: "pdfminer", "pypdf".
+            Defaults to "pypdfium2". Available loaders: "pypdfium2", "pdfminer", "pypdf".
         clean_text (bool, optional): If True, the extracted text will be cleaned by removing references and unnecessary whitespaces.
+        n_workers (int, optional): The number of threads used to download the PDFs concurrently, at least 1. The text of the
+            downloaded PDFs is extracted in parallel using one process per CPU. Defaults to 8.
+        compression (str, optional): The compression codec of the text stored in the HDF5 files. Defaults to "gzip".
+            Available codecs: "gzip", "blosc-zstd". The "blosc-zstd" codec requires `hdf5plugin` to write and read the files.
 
     Returns:
         tuple[list[Path], list[ArxivPaper]]: A tuple containing a list of Paths to the downloaded PDFs and a list of ArxivPaper objects
             with the extracted text.
     """
-    if loader not in ["pdfminer", "pypdf"]:
+    if loader not in AVAILABLE_LOADERS:
         raise ValueError(
-            f"Invalid loader: {loader}. Available loaders: 'pdfminer', 'pypdf'."
+            f"Invalid loader: {loader}. Available loaders: {', '.join(AVAILABLE_LOADERS)}."
         )
+    if n_workers < 1:
+        raise ValueError(
+            f"Invalid number of workers: {n_workers}. It has to be at least 1."
+        )
+
+    # Checking the compression codec, so an invalid codec or a missing `hdf5plugin` fail before downloading any paper
+    get_text_compression(compression)
+
+    # Compiling the regex pattern once, so invalid patterns fail before downloading any paper
+    regex = re.compile(regex_pattern) if regex_pattern else None
 
     # check if `download_path` exists, and if not, create it
     download_path = Path(download_path)
     download_path.mkdir(parents=True, exist_ok=True)
 
     # Initializing classes
+    downloader = ArxivDownloader(
+        download_path=download_path, pool_size=n_workers, logger=logger
+    )
     fetcher = ArxivFetcher(
         download_path=download_path,
         category=category,
         start_id=start_id,
         start_from_filepath=start_from_filepath,
         logger=logger,
+        session=downloader.session,
     )
-    downloader = ArxivDownloader(download_path=download_path, logger=logger)
-    extractor = TextExtractor(logger=logger)
 
     pattern_files: list[Path] = []
     pattern_papers: list[ArxivPaper] = []
-    with click.progressbar(
-        length=n_papers, label="Downloading and processing papers"
-    ) as bar:
+    with (
+        click.progressbar(
+            length=n_papers, label="Downloading and processing papers"
+        ) as bar,
+        ThreadPoolExecutor(max_workers=n_workers) as download_executor,
+        # `spawn` avoids forking the process while the download threads are running, which can deadlock
+        ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn")
+        ) as extract_executor,
+    ):
         while len(pattern_papers) < n_papers:
             papers = fetcher.fetch(
                 n_papers=n_papers,
                 n_pattern_papers=len(pattern_papers),
             )
-            for paper in papers:
-                pdf_path = downloader.download_pdf(arxiv_paper=paper)
-                text = extractor.get_text(pdf_path=pdf_path, loader=loader)
-                if not text:
-                    logger.info("No text extracted from the PDF.")
-                    continue
-                if clean_text:
-                    text = extractor.delete_references(text=text)
-                    text = extractor.clean_text(text=text)
-
-                # Deleting downloaded PDFS that do not match the regex pattern
-                regex = re.compile(regex_pattern) if regex_pattern else None
-                if regex and not regex.search(text):
-                    pdf_path.unlink()
-                    continue
-                logger.info(
-                    f"Paper {paper.id} matches the regex pattern: {regex_pattern}."
-                    " Storing metadata and text in an HDF5 file."
+            # Download the papers in chunks of `n_workers` to avoid downloading many more PDFs than needed
+            for i in range(0, len(papers), n_workers):
+                if len(pattern_papers) >= n_papers:
+                    break
+                chunk = papers[i : i + n_workers]
+                # `map` returns the PDFs in the order of `papers`, so the newest papers are kept first
+                # regardless of which download finishes first
+                pdfs = list(download_executor.map(downloader.download_pdf, chunk))
+
+                # Text extraction, cleaning and filtering are CPU-bound, so they run in separate processes
+                texts = extract_executor.map(
+                    _extract_text,
+                    pdfs,
+                    repeat(loader),
+                    repeat(clean_text),
+                    repeat(regex),
                 )
+                for paper, pdf_path, text in zip(chunk, pdfs, texts):
+                    # Deleting the extra PDFs downloaded in the last chunk
+                    if len(pattern_papers) >= n_papers:
+                        if pdf_path:
+                            pdf_path.unlink(missing_ok=True)
+                        continue
 
-                # If the paper matches the regex_pattern, store text in the corresponding ArxivPaper object
-                paper.text = text
-                paper.pdf_loader = loader
+                    # Deleting downloaded PDFS that do not match the regex pattern
+                    if text is None:
+                        pdf_path.unlink()
+                        continue
+                    if not text:
+                        logger.info("No text extracted from the PDF.")
+                        continue
+                    logger.info(
+                        f"Paper {paper.id} matches the regex pattern: {regex_pattern}."
+                        " Storing metadata and text in an HDF5 file."
+                    )
 
-                # Save the paper metadata to an HDF5 file
-                hdf_path = download_path / f"{paper.id}.hdf5"
-                save_paper_to_hdf5(paper=paper, pdf_path=pdf_path, hdf_path=hdf_path)
+                    # If the paper matches the regex_pattern, store text in the corresponding ArxivPaper object
+                    paper.text = text
+                    paper.pdf_loader = loader
 
-                # Deleting the PDF file after storing it in HDF5
-                pdf_path.unlink()
+                    # Save the paper metadata to an HDF5 file
+                    hdf_path = download_path / f"{paper.id}.hdf5"
+                    save_paper_to_hdf5(
+                        paper=paper,
+                        pdf_path=pdf_path,
+                        hdf_path=hdf_path,
+                        compression=compression,
+                    )
 
-                # Appending the HDF5 file and paper to the lists
-                pattern_files.append(hdf_path)
-                pattern_papers.append(paper)
-                bar.update(1)
+                    # Deleting the PDF file after storing it in HDF5
+                    pdf_path.unlink()
 
-                if len(pattern_papers) >= n_papers:
-                    break
+                    # Appending the HDF5 file and paper to the lists
+                    pattern_files.append(hdf_path)
+                    pattern_papers.append(paper)
+                    bar.update(1)
     return pattern_files, pattern_papers
 
 
@@ -220,12 +303,12 @@ def cli():
 @click.option(
     "--loader",
     "-l",
-    type=click.Choice(["pdfminer", "pypdf"], case_sensitive=False),
-    default="pdfminer",
+    type=click.Choice(list(AVAILABLE_LOADERS), case_sensitive=False),
+    default="pypdfium2",
     required=False,
     help="""
-    (Optional) PDF loader to use for extracting text from the downloaded PDFs. Defaults to "pdfminer".
-    Available loaders: "pdfminer", "pypdf".
+    (Optional) PDF loader to use for extracting text from the downloaded PDFs. Defaults to "pypdfium2".
+    Available loaders: "pypdfium2", "pdfminer", "pypdf".
     """,
 )
 @click.option(
@@ -239,6 +322,27 @@ def cli():
     Defaults to True.
     """,
 )
+@click.option(
+    "--n-workers",
+    "-nw",
+    type=click.IntRange(min=1),
+    default=8,
+    required=False,
+    help="""
+    (Optional) The number of threads used to download the PDFs concurrently. It has to be at least 1. Defaults to 8.
+    """,
+)
+@click.option(
+    "--compression",
+    "-comp",
+    type=click.Choice(TEXT_COMPRESSIONS, case_sensitive=False),
+    default="gzip",
+    required=False,
+    help="""
+    (Optional) The compression codec of the text stored in the HDF5 files. Defaults to "gzip".
+    Available codecs: "gzip", "blosc-zstd". The "blosc-zstd" codec requires `hdf5plugin` to write and read the files.
+    """,
+)
 def search_and_download(
     download_path,
     category,
@@ -248,6 +352,8 @@ def search_and_download(
     start_from_filepath,
     loader,
     clean_text,
+    n_workers,
+    compression,
 ):
     start_time = time.time()
 
@@ -260,6 +366,8 @@ def search_and_download(
         start_from_filepath=start_from_filepath,
         loader=loader,
         clean_text=clean_text,
+        n_workers=n_workers,
+        compression=compression,
     )
 
     elapsed_time = time.time() - start_time
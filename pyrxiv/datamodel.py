@@ -1,9 +1,51 @@
 import datetime
+import json
 
 import h5py
 import numpy as np
 from pydantic import BaseModel, Field
 
+try:
+    import hdf5plugin
+except ImportError:
+    hdf5plugin = None
+
+# Compression codecs available for the `text` dataset. "gzip" is built into HDF5, while "blosc-zstd" requires
+# `hdf5plugin` both to write and to read the dataset
+TEXT_COMPRESSIONS = ["gzip", "blosc-zstd"]
+
+# Maximum chunk size (in bytes) of the `text` dataset
+TEXT_CHUNK_SIZE = 1024 * 1024
+
+
+def get_text_compression(compression: str = "gzip") -> dict:
+    """
+    Gets the `h5py` filter options of the compression codec used for the `text` dataset.
+
+    Args:
+        compression (str, optional): The compression codec. Defaults to "gzip". Available codecs: "gzip", "blosc-zstd".
+
+    Raises:
+        ValueError: If the `compression` codec is not available.
+        ImportError: If the "blosc-zstd" codec is chosen and `hdf5plugin` is not installed.
+
+    Returns:
+        dict: The keyword arguments passed to `create_dataset` to compress the dataset.
+    """
+    if compression not in TEXT_COMPRESSIONS:
+        raise ValueError(
+            f"Invalid compression: {compression}. Available compressions: {', '.join(TEXT_COMPRESSIONS)}."
+        )
+    if compression == "gzip":
+        return {"compression": "gzip"}
+    if hdf5plugin is None:
+        raise ImportError(
+            'The "blosc-zstd" compression requires `hdf5plugin`. Install it with `pip install pyrxiv[compression]`.'
+        )
+    return dict(
+        hdf5plugin.Blosc(cname="zstd", clevel=5, shuffle=hdf5plugin.Blosc.NOSHUFFLE)
+    )
+
 
 class Author(BaseModel):
     name: str = Field(..., description="The name of the author.")
@@ -68,43 +110,60 @@ class ArxivPaper(BaseModel):
         description="The text of the arXiv paper. It is the text of the paper after cleaning and deleting references.",
     )
 
-    def to_hdf5(self, hdf_file: h5py.File) -> h5py.Group:
+    def to_hdf5(self, hdf_file: h5py.File, compression: str = "gzip") -> h5py.Group:
         """
         Stores the ArxivPaper metadata and text dataset in an HDF5 file.
 
+        The `text` is stored as a chunked and compressed dataset of UTF-8 bytes, which can be read back
+        using `group["arxiv_paper/text"][()].tobytes().decode("utf-8")`. If the text is compressed with
+        "blosc-zstd", the reader also needs `hdf5plugin` installed and imported (`import hdf5plugin`) to
+        decompress it. The lists of strings (`authors` names and `categories`) are stored as datasets, and the rest
+        of the metadata is stored as a JSON string in the `metadata` attribute of the `arxiv_paper` group.
+
         Args:
             hdf_file (h5py.File): The HDF5 file to store the metadata and text.
+            compression (str, optional): The compression codec of the `text` dataset. Defaults to "gzip", which
+                any HDF5 reader can decompress. Available codecs: "gzip", "blosc-zstd".
 
         Returns:
             h5py.Group: The group in the HDF5 file where the metadata and text are stored.
         """
+        text_compression = get_text_compression(compression)
         group = hdf_file.require_group(self.id)
         sub_group = group.require_group("arxiv_paper")
-        for key in self.model_fields:
-            if key == "id":
-                continue
-            value = getattr(self, key)
-            if key in ["updated", "published"]:
-                value = getattr(self, key).isoformat() if getattr(self, key) else None
-            if key == "authors":
-                value = [author.name for author in self.authors]
-
+        metadata = {}
+        # serializing the fields once, instead of looking them up and checking their type one by one
+        for key, value in self.model_dump(exclude={"id"}).items():
             # Skip none values
             if value is None:
                 continue
 
+            if key in ["updated", "published"]:
+                value = value.isoformat()
+            if key == "authors":
+                value = [author["name"] for author in value]
+
             # overwrite existing dataset for `text`
             if key == "text":
                 if key in sub_group:
                     del sub_group[key]
-                sub_group.create_dataset(key, data=value.encode("utf-8"))
+                data = np.frombuffer(value.encode("utf-8"), dtype=np.uint8)
+                # empty datasets cannot be chunked
+                storage = (
+                    {"chunks": (min(data.size, TEXT_CHUNK_SIZE),), **text_compression}
+                    if data.size
+                    else {}
+                )
+                sub_group.create_dataset(key, data=data, **storage)
                 continue
-            # handle lists of strings
-            if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            # handle lists of strings (`authors` names and `categories`)
+            if isinstance(value, list):
                 if key in sub_group:
                     del sub_group[key]
                 sub_group.create_dataset(key, data=value)
                 continue
             # all other attributes
-            sub_group.attrs[key] = value
+            metadata[key] = value
+        # a single attribute write for all the scalar metadata
+        sub_group.attrs["metadata"] = json.dumps(metadata)
         return group
@@ -1,18 +1,52 @@
+import shutil
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError
+from urllib3.util.retry import Retry
 
 from pyrxiv.datamodel import ArxivPaper
 from pyrxiv.logger import logger
 
 
+def create_session(pool_size: int = 32) -> requests.Session:
+    """
+    Creates a `requests` session to reuse TCP connections to arXiv. The connection pool is sized so concurrent
+    requests do not block on each other, and connection errors and transient server errors are retried with backoff.
+
+    Args:
+        pool_size (int, optional): The maximum number of connections kept alive in the session pool. Defaults to 32.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods={"GET", "HEAD"},
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class ArxivDownloader:
-    def __init__(self, download_path: Path = Path("data"), **kwargs):
+    def __init__(
+        self, download_path: Path = Path("data"), pool_size: int = 32, **kwargs
+    ):
         """
         Initializes the ArxivDownloader with a specified download path and logger.
 
         Args:
             download_path (str): The path where the downloaded PDFs will be stored. Defaults to "data".
+            pool_size (int): The maximum number of connections kept alive in the `requests` session pool. It should be
+                at least the number of threads downloading PDFs concurrently. Defaults to 32.
             logger: A logger instance for logging messages. If None, a default logger will be used.
         """
         download_path.mkdir(parents=True, exist_ok=True)
@@ -20,10 +54,7 @@ class ArxivDownloader:
 
         self.logger = kwargs.get("logger", logger)
 
-        # ! an initial short paper is used to warm up the `requests` session connection
-        # ! otherwise, long papers get stuck on `requests.get()` due to connection timeouts
-        self.session = requests.Session()  # Reuse TCP connection
-        self.session.head("http://arxiv.org/pdf/2502.10309v1", timeout=30)
+        self.session = create_session(pool_size=pool_size)  # Reuse TCP connection
 
     def download_pdf(self, arxiv_paper: ArxivPaper, write: bool = True) -> Path:
         """
@@ -44,14 +75,15 @@ class ArxivDownloader:
 
             pdf_path = self.download_path / f"{arxiv_paper.id}.pdf"
             if write:
+                # decode any content encoding, and copy the raw stream to disk in 1 MB blocks
+                response.raw.decode_content = True
                 with open(pdf_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
             # ! too many messages, so I commented this out
             # self.logger.info(f"PDF downloaded: {pdf_path}")
-        except requests.exceptions.RequestException as e:
+        # reading from `response.raw` raises `urllib3` errors instead of `requests` ones
+        except (requests.exceptions.RequestException, HTTPError) as e:
             self.logger.error(f"Failed to download PDF: {e}")
             pdf_path = None
         return pdf_path
@@ -1,10 +1,43 @@
 import re
 from pathlib import Path
 
-from langchain_community.document_loaders import PDFMinerLoader, PyPDFLoader
+from langchain_community.document_loaders import (
+    PDFMinerLoader,
+    PyPDFium2Loader,
+    PyPDFLoader,
+)
 
 from pyrxiv.logger import logger
 
+# Implemented loaders from LangChain
+AVAILABLE_LOADERS = {
+    "pypdf": PyPDFLoader,
+    "pdfminer": PDFMinerLoader,
+    "pypdfium2": PyPDFium2Loader,
+}
+
+# Delimiters of the references section used in `TextExtractor.delete_references`
+REFERENCES_START_PATTERN = re.compile(
+    r"(?:\nReferences\n|\nBibliography\n|\n\[1\] *[A-Z])", flags=re.IGNORECASE
+)
+REFERENCES_END_PATTERN = re.compile(
+    r"(?:\nSupplemental Material[\:\n]*|\nSupplemental Information[\:\n]*|\nAppendices[\:\n]*)",
+    flags=re.IGNORECASE,
+)
+
+# Substitutions applied in order by `TextExtractor.clean_text`
+CLEAN_TEXT_SUBSTITUTIONS = [
+    # Fix hyphenated line breaks: e.g., "super-\nconductivity" → "superconductivity"
+    (re.compile(r"-\s*\n\s*"), ""),
+    # Remove arXiv identifiers like 'arXiv:2301.12345'
+    (re.compile(r"arXiv:\d{4}\.\d{4,5}(v\d+)?"), ""),
+    # Normalize spacing
+    (re.compile(r"[ \t]+"), " "),  # collapse multiple spaces/tabs
+    (re.compile(r"\n[ \t]+"), "\n"),  # remove indentations
+    # Replace newline characters with spaces (this also collapses multiple newlines)
+    (re.compile(r"\n+"), " "),
+]
+
 
 class TextExtractor:
     """
@@ -15,12 +48,6 @@ class TextExtractor:
     def __init__(self, **kwargs):
         self.logger = kwargs.get("logger", logger)
 
-        # Implemented loaders from LangChain
-        self.available_loaders = {
-            "pypdf": PyPDFLoader,
-            "pdfminer": PDFMinerLoader,
-        }
-
     def _check_pdf_path(self, pdf_path: str | None | Path = ".") -> bool:
         """
         Check if the PDF path is valid.
@@ -62,18 +89,15 @@ class TextExtractor:
         filepath = pdf_path
 
         # Check if the loader is available
-        if loader not in self.available_loaders.keys():
+        if loader not in AVAILABLE_LOADERS:
             self.logger.error(
-                f"Loader {loader} not available. Available loaders: {self.available_loaders.keys()}"
+                f"Loader {loader} not available. Available loaders: {AVAILABLE_LOADERS.keys()}"
             )
             return ""
-        loader_cls = self.available_loaders[loader](filepath)
+        loader_cls = AVAILABLE_LOADERS[loader](filepath)
 
         # Extract text
-        text = ""
-        for page in loader_cls.lazy_load():
-            text += page.page_content
-        return text
+        return "".join(page.page_content for page in loader_cls.lazy_load())
 
     def delete_references(self, text: str = "") -> str:
         """
@@ -85,11 +109,8 @@ class TextExtractor:
         Returns:
             str: The text without the references section if a match is found.
         """
-        pattern_start = "(?:\nReferences\n|\nBibliography\n|\n\[1\] *[A-Z])"
-        pattern_end = "(?:\nSupplemental Material[\:\n]*|\nSupplemental Information[\:\n]*|\nAppendices[\:\n]*)"
-
-        match_start = re.search(pattern_start, text, flags=re.IGNORECASE)
-        match_end = re.search(pattern_end, text, flags=re.IGNORECASE)
+        match_start = REFERENCES_START_PATTERN.search(text)
+        match_end = REFERENCES_END_PATTERN.search(text)
         if match_start:
             start = match_start.start()
             if match_end:
@@ -117,20 +138,8 @@ class TextExtractor:
             self.logger.warning("No text provided for cleaning.")
             return ""
 
-        # Fix hyphenated line breaks: e.g., "super-\nconductivity" → "superconductivity"
-        text = re.sub(r"-\s*\n\s*", "", text)
-
-        # Replace multiple newlines with a single newline
-        text = re.sub(r"\n{2,}", "\n\n", text)
-
-        # Remove arXiv identifiers like 'arXiv:2301.12345'
-        text = re.sub(r"arXiv:\d{4}\.\d{4,5}(v\d+)?", "", text)
-
-        # Normalize spacing
-        text = re.sub(r"[ \t]+", " ", text)  # collapse multiple spaces/tabs
-        text = re.sub(r"\n[ \t]+", "\n", text)  # remove indentations
-
-        # Replace newline characters with spaces
-        text = re.sub(r"\n+", " ", text)
+        # The substitutions depend on each other, so they are applied in order
+        for pattern, replacement in CLEAN_TEXT_SUBSTITUTIONS:
+            text = pattern.sub(replacement, text)
 
         return text.strip()
@@ -1,12 +1,113 @@
+import datetime
 import re
-import urllib.request
+from io import BytesIO
 from pathlib import Path
 
-import xmltodict
+from lxml import etree
+from pydantic import BaseModel, ValidationError
 
 from pyrxiv.datamodel import ArxivPaper, Author
+from pyrxiv.download import create_session
 from pyrxiv.logger import logger
 
+# Namespaces used in the Atom feed returned by the arXiv API
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+ARXIV_NAMESPACE = "http://arxiv.org/schemas/atom"
+NAMESPACES = {"atom": ATOM_NAMESPACE, "arxiv": ARXIV_NAMESPACE}
+
+# Namespaced tags of the Atom feed, built once to be compared against the `tag` of the parsed elements
+ENTRY_TAG = f"{{{ATOM_NAMESPACE}}}entry"
+ID_TAG = f"{{{ATOM_NAMESPACE}}}id"
+UPDATED_TAG = f"{{{ATOM_NAMESPACE}}}updated"
+PUBLISHED_TAG = f"{{{ATOM_NAMESPACE}}}published"
+TITLE_TAG = f"{{{ATOM_NAMESPACE}}}title"
+SUMMARY_TAG = f"{{{ATOM_NAMESPACE}}}summary"
+AUTHOR_TAG = f"{{{ATOM_NAMESPACE}}}author"
+NAME_TAG = f"{{{ATOM_NAMESPACE}}}name"
+AFFILIATION_TAG = f"{{{ATOM_NAMESPACE}}}affiliation"
+CATEGORY_TAG = f"{{{ATOM_NAMESPACE}}}category"
+COMMENT_TAG = f"{{{ARXIV_NAMESPACE}}}comment"
+
+# Number of pages and figures in the comment of the arXiv paper, e.g. "10 pages, 2 figures"
+PAGES_FIGURES_PATTERN = re.compile(r" *(\d+) *pages *, *(\d+) *figures *")
+
+# New-style arXiv ID of the form 'yymm.number[vN]', e.g. "2201.00001v1"
+ARXIV_ID_PATTERN = re.compile(r"^(\d{4})\.(\d{5})")
+
+# Fields of `_RawEntry` stored in each child element of the `entry` element, keyed by the namespaced tag
+ENTRY_FIELDS = {
+    ID_TAG: "id",
+    UPDATED_TAG: "updated",
+    PUBLISHED_TAG: "published",
+    TITLE_TAG: "title",
+    SUMMARY_TAG: "summary",
+    AUTHOR_TAG: "authors",
+    COMMENT_TAG: "comment",
+    CATEGORY_TAG: "categories",
+}
+
+
+def _find_text(element: etree._Element, path: str) -> str | None:
+    """
+    Finds the text of the first subelement matching `path` in the `element`, stripped of surrounding whitespaces.
+
+    Args:
+        element (etree._Element): The XML element to search in.
+        path (str): The path of the subelement, either a namespaced tag (e.g., `TITLE_TAG`) or prefixed with the
+            namespaces defined in `NAMESPACES`.
+
+    Returns:
+        str | None: The stripped text of the subelement, or None if the subelement is not found.
+    """
+    text = element.findtext(path, namespaces=NAMESPACES)
+    return text.strip() if text is not None else None
+
+
+class _RawEntry(BaseModel):
+    """The metadata of an entry of the arXiv Atom feed, validated before building an `ArxivPaper`."""
+
+    id: str | None = None
+    updated: datetime.datetime | None = None
+    published: datetime.datetime | None = None
+    title: str
+    summary: str | None = None
+    authors: list[Author] = []
+    comment: str = ""
+    categories: list[str] = []
+
+    @classmethod
+    def from_xml(cls, entry: etree._Element) -> "_RawEntry":
+        """
+        Validates the metadata of the `entry` element of the arXiv Atom feed.
+
+        Args:
+            entry (etree._Element): The `entry` element of the arXiv Atom feed.
+
+        Raises:
+            ValidationError: If the metadata of the `entry` is not valid.
+
+        Returns:
+            _RawEntry: The validated metadata of the entry.
+        """
+        # Collecting all the fields in a single pass over the children of `entry`
+        metadata: dict = {"authors": [], "categories": []}
+        for child in entry:
+            field = ENTRY_FIELDS.get(child.tag)
+            if field == "authors":
+                metadata["authors"].append(
+                    {
+                        "name": _find_text(child, NAME_TAG),
+                        "affiliation": _find_text(child, AFFILIATION_TAG),
+                    }
+                )
+            elif field == "categories":
+                metadata["categories"].append(child.get("term"))
+            # only the first occurrence of each text field is kept
+            elif field and field not in metadata:
+                metadata[field] = (child.text or "").strip()
+        metadata["comment"] = metadata.get("comment") or ""
+        return cls.model_validate(metadata)
+
 
 class ArxivFetcher:
     """Fetch papers from arXiv and extract metadata from the queried papers."""
@@ -24,7 +125,7 @@ class ArxivFetcher:
         """
         Initialize the ArxivFetcher class.
         This class fetches papers from arXiv and extracts metadata from the queried papers.
-        It uses the `requests` library to fetch the papers and the `xmltodict` library to parse the XML response.
+        It uses the `requests` library to fetch the papers and the `lxml` library to parse the XML response.
         It also uses the `ArxivPaper` and `Author` datamodels to store the metadata of the papers.
 
 
@@ -38,6 +139,8 @@ class ArxivFetcher:
                 This is useful for resuming the search from a specific point. If False, the search will start from the newest papers in the `category`.
                 Defaults to False.
             fetched_ids_file (str, optional): The file where to store the fetched arXiv IDs. Defaults to "fetched_arxiv_ids.txt".
+            session (requests.Session, optional): A `requests` session used to query the arXiv API. It can be shared with
+                the `ArxivDownloader` to reuse connections. If None, a new session will be created.
         """
         self.max_results = max_results
         self.category = category
@@ -65,6 +168,9 @@ class ArxivFetcher:
 
         self.logger = kwargs.get("logger", logger)
 
+        # Reuse TCP connection across batches
+        self.session = kwargs.get("session") or create_session()
+
     def _last_fetched_id(self, fetched_ids_file: str | Path) -> str:
         """
         Gets the last fetched arXiv ID from the specified file.
@@ -80,11 +186,8 @@ class ArxivFetcher:
         if isinstance(fetched_ids_file, str):
             fetched_ids_file = Path(fetched_ids_file)
 
-        last_id = ""
-        with fetched_ids_file.open("r", encoding="utf-8") as f:
-            lines = [line.strip() for line in f if line.strip()]
-            last_id = lines[-1] if lines else ""
-        return last_id
+        fetched_ids = fetched_ids_file.read_text(encoding="utf-8").split()
+        return fetched_ids[-1] if fetched_ids else ""
 
     def _get_pages_and_figures(self, comment: str) -> tuple[int | None, int | None]:
         """
@@ -97,8 +200,7 @@ class ArxivFetcher:
             tuple[int | None, int | None]: A tuple containing the number of pages and figures.
                 If not found, returns (None, None).
         """
-        pattern = r" *(\d+) *pages *, *(\d+) *figures *"
-        match = re.search(pattern, comment)
+        match = PAGES_FIGURES_PATTERN.search(comment)
         if match:
             n_pages, n_figures = match.groups()
             return int(n_pages), int(n_figures)
@@ -115,7 +217,7 @@ class ArxivFetcher:
         """
 
         def normalize(arxiv_id: str) -> tuple[int | None, int | None]:
-            match = re.match(r"^(\d{4})\.(\d{5})", arxiv_id)
+            match = ARXIV_ID_PATTERN.match(arxiv_id)
             if not match:
                 return None, None
             return int(match.group(1)), int(match.group(2))
@@ -141,6 +243,70 @@ class ArxivFetcher:
         else:
             return paper_id_norm[0] > reference_id_norm[0]
 
+    def _paper_from_entry(self, new_paper: etree._Element) -> ArxivPaper | None:
+        """
+        Validates the `entry` element of the arXiv Atom feed and stores its metadata in an `ArxivPaper`.
+
+        Args:
+            new_paper (etree._Element): The `entry` element of the arXiv Atom feed.
+
+        Returns:
+            ArxivPaper | None: The `ArxivPaper` with the metadata of the entry, or None if the entry is skipped.
+        """
+        # If the metadata is not valid, skip the paper
+        try:
+            entry = _RawEntry.from_xml(new_paper)
+        except ValidationError as e:
+            fields = ", ".join(
+                ".".join(str(loc) for loc in error["loc"]) for error in e.errors()
+            )
+            self.logger.error(
+                f"Paper {_find_text(new_paper, ID_TAG)} with invalid metadata: {fields}"
+            )
+            return None
+
+        # If there is an error in the fetching, skip the paper
+        if "Error" in entry.title:
+            self.logger.error("Error fetching the paper")
+            return None
+
+        # If there is no `id`, skip the paper
+        url_id = entry.id
+        if not url_id or "arxiv.org" not in url_id:
+            self.logger.error(f"Paper without a valid URL id: {url_id}")
+            return None
+
+        # Getting arXiv `id`, and skipping if newer than the `start_id`
+        arxiv_id = url_id.split("/")[-1].replace(".pdf", "")
+        if self.skip_newer_ids and self.is_newer_than(arxiv_id, self.start_id):
+            return None
+
+        # If there is no `summary`, skip the paper
+        if not entry.summary:
+            self.logger.error(f"Paper {url_id} without summary/abstract")
+            return None
+
+        if not entry.authors:
+            self.logger.info("\tPaper without authors.")
+
+        # Extracting pages and figures from the comment
+        n_pages, n_figures = self._get_pages_and_figures(comment=entry.comment)
+
+        return ArxivPaper(
+            id=arxiv_id,
+            url=url_id,
+            pdf_url=url_id.replace("abs", "pdf"),
+            updated=entry.updated,
+            published=entry.published,
+            title=entry.title,
+            summary=entry.summary,
+            authors=entry.authors,
+            comment=entry.comment,
+            n_pages=n_pages,
+            n_figures=n_figures,
+            categories=entry.categories,
+        )
+
     def fetch(
         self,
         n_papers: int,
@@ -175,112 +341,54 @@ class ArxivFetcher:
                 f"sortBy=submittedDate&sortOrder=descending"
             )
 
-            request = urllib.request.urlopen(url)
-            data = request.read().decode("utf-8")
-            data_dict = xmltodict.parse(data)
-
-            # Extracting papers from the XML response
-            batch = data_dict.get("feed", {}).get("entry", [])
-            if not batch:
-                self.logger.info("No papers found in the response")
-                return []
-            # In case `max_results` is 1, the response is not a list
-            if not isinstance(batch, list):
-                batch = [batch]
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
 
-            # Store papers object ArxivPaper in a list
+            # Streaming the `entry` elements of the XML response, so each entry is released once parsed
+            # and the whole feed tree is never kept in memory
+            n_entries = 0
             initial_len = len(papers)
-            for new_paper in batch:
-                # If there is an error in the fetching, skip the paper
-                if "Error" in new_paper.get("title", ""):
-                    self.logger.error("Error fetching the paper")
-                    # new_papers = papers
-                    continue
-
-                # If there is no `id`, skip the paper
-                url_id = new_paper.get("id")
-                if not url_id or "arxiv.org" not in url_id:
-                    self.logger.error(f"Paper without a valid URL id: {url_id}")
-                    # new_papers = papers
-                    continue
-
-                # Getting arXiv `id`, and skipping if newer than the `start_id`
-                arxiv_id = url_id.split("/")[-1].replace(".pdf", "")
-                if self.skip_newer_ids and self.is_newer_than(arxiv_id, self.start_id):
-                    continue
-
-                # If there is no `summary`, skip the paper
-                summary = new_paper.get("summary")
-                if not summary:
-                    self.logger.error(f"Paper {url_id} without summary/abstract")
-                    # new_papers = papers
-                    continue
-
-                # Extracting `authors` from the XML response
-                paper_authors = new_paper.get("author", [])
-                if not isinstance(paper_authors, list):
-                    paper_authors = [paper_authors]
-                authors = [
-                    Author(
-                        name=author.get("name"), affiliation=author.get("affiliation")
-                    )
-                    for author in paper_authors
-                ]
-                if not authors:
-                    self.logger.info("\tPaper without authors.")
-
-                # Extracting `categories` from the XML response
-                arxiv_categories = new_paper.get("category", [])
-                if not isinstance(arxiv_categories, list):
-                    categories = [arxiv_categories.get("@term")]
-                else:
-                    categories = [
-                        category.get("@term") for category in arxiv_categories
-                    ]
-
-                # Extracting pages and figures from the comment
-                comment = new_paper.get("arxiv:comment", {}).get("#text", "")
-                n_pages, n_figures = self._get_pages_and_figures(comment=comment)
-
-                # Storing the ArxivPaper object in the list
-                papers.append(
-                    ArxivPaper(
-                        id=arxiv_id,
-                        url=url_id,
-                        pdf_url=url_id.replace("abs", "pdf"),
-                        updated=new_paper.get("updated"),
-                        published=new_paper.get("published"),
-                        title=new_paper.get("title"),
-                        summary=summary,
-                        authors=authors,
-                        comment=comment,
-                        n_pages=n_pages,
-                        n_figures=n_figures,
-                        categories=categories,
-                    )
-                )
-
-                # ! too many messages, so I commented this out
-                # self.logger.info(f"Paper {arxiv_id} fetched from arXiv.")
+            for _, new_paper in etree.iterparse(
+                BytesIO(response.content), events=("end",), tag=ENTRY_TAG
+            ):
+                n_entries += 1
+                # Making sure we do not exceed the number of papers to fetch, while still counting the
+                # remaining entries of the batch
+                if len(papers) < self.max_results:
+                    # Store papers object ArxivPaper in a list
+                    paper = self._paper_from_entry(new_paper)
+                    if paper is not None:
+                        papers.append(paper)
+
+                    # ! too many messages, so I commented this out
+                    # self.logger.info(f"Paper {arxiv_id} fetched from arXiv.")
+
+                # Freeing the parsed entry and the already processed siblings
+                new_paper.clear()
+                while new_paper.getprevious() is not None:
+                    del new_paper.getparent()[0]
+
+            # Exiting the loop at the end of the feed, keeping the papers of the previous batches
+            if not n_entries:
+                self.logger.info("No papers found in the response")
+                break
 
-                # Making sure we do not exceed the number of papers to fetch
-                if len(papers) >= self.max_results:
-                    break
+            # Incrementing the start index by the number of entries returned, so the next batch (or the next
+            # call to `fetch`) does not request the same entries again
+            batch_start_index = self.start_index
+            self.start_index += n_entries
 
             # safeguard: break if no valid papers were added in this batch
             if len(papers) == initial_len:
                 self.logger.warning(
-                    f"No valid papers added in batch starting at index {self.start_index}. "
+                    f"No valid papers added in batch starting at index {batch_start_index}. "
                     "This might indicate that all were skipped (e.g. newer than start_id, invalid, etc.). Exiting loop."
                 )
                 break
 
-            # Incrementing the start index for the next batch
-            self.start_index += self.max_results
-
-        # If the fetched results are less than the starting point, increment the start index
-        if not papers:
-            self.start_index += self.max_results
+            # The end of the feed is reached if less entries than requested are returned
+            if n_entries < current_batch_size:
+                break
 
         # Storing last fetched ID to the file if `start_from_filepath` is specified
         if write and papers:
@@ -1,3 +1,4 @@
+import copy
 import datetime
 import os
 from pathlib import Path
@@ -5,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from pyrxiv.datamodel import ArxivPaper
+from pyrxiv.fetch import ArxivFetcher
 from pyrxiv.logger import log_storage
 
 if os.getenv("_PYTEST_RAISE", "0") != "0":
@@ -25,6 +27,27 @@ def cleared_log_storage():
     yield log_storage
 
 
+@pytest.fixture(scope="session")
+def _arxiv_fetcher_template(tmp_path_factory: pytest.TempPathFactory) -> ArxivFetcher:
+    """Fixture to create the `ArxivFetcher` (and its `requests` session) only once per test session."""
+    return ArxivFetcher(download_path=tmp_path_factory.mktemp("data"))
+
+
+@pytest.fixture
+def arxiv_fetcher(
+    _arxiv_fetcher_template: ArxivFetcher, tmp_path: Path
+) -> ArxivFetcher:
+    """
+    Fixture to copy the `ArxivFetcher` template, storing the `fetched_arxiv_ids.txt` file in a temporary directory.
+    The copy is shallow, so the session is shared while the fetching state (e.g., `start_index`) is per test.
+    """
+    arxiv_fetcher = copy.copy(_arxiv_fetcher_template)
+    arxiv_fetcher.fetched_ids_file = (
+        tmp_path / _arxiv_fetcher_template.fetched_ids_file.name
+    )
+    return arxiv_fetcher
+
+
 def generate_arxiv_paper(id: str = "1234.5678v1"):
     return ArxivPaper(
         id=id,
@@ -0,0 +1,94 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from pyrxiv.cli.cli import cli, run_search_and_download
+from pyrxiv.datamodel import ArxivPaper
+from tests.conftest import generate_arxiv_paper
+
+ARXIV_IDS = ["2502.10100v1", "2502.10101v1", "2502.10102v1", "2502.10103v1"]
+
+
+class TestRunSearchAndDownload:
+    """Tests for the `run_search_and_download` function."""
+
+    @pytest.mark.parametrize(
+        "no_match_ids, result",
+        [
+            # all papers match, so the extra PDF of the last chunk is deleted
+            ([], ["2502.10100v1", "2502.10101v1", "2502.10102v1"]),
+            # the PDF not matching the pattern is deleted, and the next paper is stored instead
+            (["2502.10101v1"], ["2502.10100v1", "2502.10102v1", "2502.10103v1"]),
+        ],
+    )
+    def test_run_search_and_download(
+        self, tmp_path: Path, no_match_ids: list[str], result: list[str]
+    ):
+        """
+        Tests that `run_search_and_download` processes the papers in chunks of `n_workers` keeping the order of
+        the fetched papers, and that all the downloaded PDFs are deleted.
+        """
+        papers = [generate_arxiv_paper(id=arxiv_id) for arxiv_id in ARXIV_IDS]
+
+        def download_pdf(arxiv_paper: ArxivPaper) -> Path:
+            # the newest papers are downloaded last, so the completion order differs from the order of `papers`
+            time.sleep(0.05 * (len(ARXIV_IDS) - ARXIV_IDS.index(arxiv_paper.id)))
+            pdf_path = tmp_path / f"{arxiv_paper.id}.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4")
+            return pdf_path
+
+        def extract_text(pdf_path: Path, *args) -> str | None:
+            return None if pdf_path.stem in no_match_ids else "Some text."
+
+        with (
+            patch("pyrxiv.cli.cli.ArxivFetcher.fetch", return_value=papers),
+            patch(
+                "pyrxiv.cli.cli.ArxivDownloader.download_pdf", side_effect=download_pdf
+            ),
+            patch("pyrxiv.cli.cli._extract_text", side_effect=extract_text),
+            # extracting in threads, so the patched `_extract_text` is used
+            patch(
+                "pyrxiv.cli.cli.ProcessPoolExecutor",
+                side_effect=lambda **kwargs: ThreadPoolExecutor(),
+            ),
+        ):
+            pattern_files, pattern_papers = run_search_and_download(
+                download_path=tmp_path, n_papers=3, n_workers=2
+            )
+
+        assert [paper.id for paper in pattern_papers] == result
+        assert pattern_files == [tmp_path / f"{arxiv_id}.hdf5" for arxiv_id in result]
+        assert all(paper.text == "Some text." for paper in pattern_papers)
+        assert sorted(path.name for path in tmp_path.glob("*.hdf5")) == [
+            f"{arxiv_id}.hdf5" for arxiv_id in result
+        ]
+        # stored, extra, and not matching PDFs are all deleted
+        assert not list(tmp_path.glob("*.pdf"))
+
+    @pytest.mark.parametrize("n_workers", [0, -1])
+    def test_invalid_n_workers(self, tmp_path: Path, n_workers: int):
+        """Tests that an invalid `n_workers` fails before initializing the downloader and fetcher."""
+        with (
+            patch("pyrxiv.cli.cli.ArxivDownloader") as mock_downloader,
+            pytest.raises(ValueError, match="Invalid number of workers"),
+        ):
+            run_search_and_download(download_path=tmp_path, n_workers=n_workers)
+        mock_downloader.assert_not_called()
+
+        # the CLI rejects it when parsing the options
+        result = CliRunner().invoke(
+            cli,
+            [
+                "search_and_download",
+                "--download-path",
+                str(tmp_path),
+                "--n-workers",
+                str(n_workers),
+            ],
+        )
+        assert result.exit_code == 2
+        assert f"{n_workers} is not in the range x>=1" in result.output
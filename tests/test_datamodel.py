@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+import h5py
+import pytest
+
+from pyrxiv.datamodel import get_text_compression
+from tests.conftest import generate_arxiv_paper
+
+
+class TestArxivPaper:
+    @pytest.mark.parametrize(
+        "text, compression",
+        [
+            # empty text
+            ("", "gzip"),
+            # non-ASCII text
+            ("Sample PDF with a ﬁle about the Hubbard model and DMFT. " * 100, "gzip"),
+            # non-ASCII text compressed with Blosc-zstd
+            (
+                "Sample PDF with a ﬁle about the Hubbard model and DMFT. " * 100,
+                "blosc-zstd",
+            ),
+        ],
+    )
+    def test_to_hdf5(self, tmp_path: Path, text: str, compression: str):
+        """Tests the `to_hdf5` method of the `ArxivPaper` class."""
+        if compression == "blosc-zstd":
+            # `hdf5plugin` is optional, and it registers the Blosc filter to write and read the dataset
+            pytest.importorskip("hdf5plugin")
+        paper = generate_arxiv_paper()
+        paper.text = text
+        with h5py.File(tmp_path / "paper.hdf5", "w") as h5f:
+            group = paper.to_hdf5(hdf_file=h5f, compression=compression)
+            assert group.name == "/1234.5678v1"
+
+            dataset = group["arxiv_paper/text"]
+            assert (dataset.chunks is not None) == bool(text)
+            if text and compression == "gzip":
+                assert dataset.compression == "gzip"
+            assert dataset[()].tobytes().decode("utf-8") == text
+            metadata = json.loads(group["arxiv_paper"].attrs["metadata"])
+            assert metadata == {
+                "url": "http://arxiv.org/abs/1234.5678v1",
+                "pdf_url": "http://arxiv.org/pdf/1234.5678v1",
+                "updated": "2024-04-25T00:00:00+00:00",
+                "published": "2024-04-25T00:00:00+00:00",
+                "title": "Test Title",
+                "summary": "A summary or abstract.",
+                "comment": "",
+            }
+
+
+@pytest.mark.parametrize(
+    "compression, installed, error",
+    [
+        # invalid codec
+        ("lzma", True, ValueError),
+        # Blosc-zstd without `hdf5plugin`
+        ("blosc-zstd", False, ImportError),
+    ],
+)
+def test_get_text_compression_errors(
+    monkeypatch: pytest.MonkeyPatch, compression: str, installed: bool, error: type
+):
+    """Tests that `get_text_compression` fails for invalid codecs and when `hdf5plugin` is not installed."""
+    if not installed:
+        monkeypatch.setattr("pyrxiv.datamodel.hdf5plugin", None)
+    with pytest.raises(error):
+        get_text_compression(compression)
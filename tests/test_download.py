@@ -1,10 +1,25 @@
+import io
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
+from urllib3.exceptions import ProtocolError
 
 from pyrxiv.download import ArxivDownloader
 from tests.conftest import generate_arxiv_paper
 
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * (3 * 1024 * 1024)
+
+
+class BrokenStream(io.BytesIO):
+    """Raw stream raising a `urllib3` error after the first read, as when the connection drops mid-download."""
+
+    def read(self, size: int = -1) -> bytes:
+        if self.tell():
+            raise ProtocolError("Connection broken: IncompleteRead")
+        return super().read(size)
+
 
 class TestArxivDownloader:
     @pytest.mark.parametrize(
@@ -45,3 +60,47 @@ class TestArxivDownloader:
         if log_msg:
             assert cleared_log_storage[0]["level"] == log_msg["level"]
             assert cleared_log_storage[0]["event"] == log_msg["event"]
+
+    @pytest.mark.parametrize(
+        "raw, downloaded, log_msg",
+        [
+            # the whole stream is copied to the PDF file
+            (io.BytesIO(PDF_BYTES), True, {}),
+            # the connection drops part-way through the stream
+            (
+                BrokenStream(PDF_BYTES),
+                False,
+                {
+                    "level": "error",
+                    "event": "Failed to download PDF: Connection broken: IncompleteRead",
+                },
+            ),
+        ],
+    )
+    def test_download_pdf_stream(
+        self,
+        tmp_path: Path,
+        cleared_log_storage: list,
+        raw: io.BytesIO,
+        downloaded: bool,
+        log_msg: dict,
+    ):
+        """Tests that `download_pdf` copies the raw response stream to the PDF file, and handles `urllib3` errors."""
+        arxiv_paper = generate_arxiv_paper()
+        arxiv_downloader = ArxivDownloader(download_path=tmp_path)
+        response = SimpleNamespace(raw=raw, raise_for_status=lambda: None)
+        with patch.object(
+            arxiv_downloader.session, "get", return_value=response
+        ) as mock_get:
+            pdf_path = arxiv_downloader.download_pdf(arxiv_paper)
+        mock_get.assert_called_once_with(arxiv_paper.pdf_url, stream=True, timeout=60)
+        assert raw.decode_content
+        if downloaded:
+            assert pdf_path == tmp_path / "1234.5678v1.pdf"
+            assert pdf_path.read_bytes() == PDF_BYTES
+            assert not cleared_log_storage
+        else:
+            assert pdf_path is None
+            assert len(cleared_log_storage) == 1
+            assert cleared_log_storage[0]["level"] == log_msg["level"]
+            assert cleared_log_storage[0]["event"] == log_msg["event"]
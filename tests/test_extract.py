@@ -37,6 +37,8 @@ class TestTextExtractor:
             ("tests/data/sample.pdf", "pypdf", 2876),
             # successful with pdfminer
             ("tests/data/sample.pdf", "pdfminer", 3118),
+            # successful with pypdfium2
+            ("tests/data/sample.pdf", "pypdfium2", 2879),
         ],
     )
     def test_get_text(self, pdf_path: str, loader: str, length_text: int):
@@ -1,5 +1,7 @@
 import datetime
+import textwrap
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,6 +9,212 @@ import pytest
 from pyrxiv.datamodel import ArxivPaper
 from pyrxiv.fetch import ArxivFetcher
 
+# Cases of arXiv API responses, the expected first log message, and the expected `ArxivPaper.model_dump()`
+FETCH_CASES = [
+    # Empty response
+    (
+        """
+        <feed xmlns="http://www.w3.org/2005/Atom"></feed>
+        """,
+        {"level": "info", "event": "No papers found in the response"},
+        {},
+    ),
+    # Error in title when fetching
+    (
+        """
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <title>Error when fetching the paper</title>
+            </entry>
+        </feed>
+        """,
+        {"level": "error", "event": "Error fetching the paper"},
+        {},
+    ),
+    # Id not in the correct format
+    (
+        """
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <title>Test Paper Title</title>
+                <id>not a proper arxiv id</id>
+            </entry>
+        </feed>
+        """,
+        {
+            "level": "error",
+            "event": "Paper without a valid URL id: not a proper arxiv id",
+        },
+        {},
+    ),
+    # Missing summary
+    (
+        """
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <title>Test Paper Title</title>
+                <id>http://arxiv.org/abs/1234.5678v1</id>
+            </entry>
+        </feed>
+        """,
+        {
+            "level": "error",
+            "event": "Paper http://arxiv.org/abs/1234.5678v1 without summary/abstract",
+        },
+        {},
+    ),
+    # Author without name
+    (
+        """
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <title>Test Paper Title</title>
+                <id>http://arxiv.org/abs/1234.5678v1</id>
+                <summary>This is a test abstract.</summary>
+                <author>
+                    <affiliation>University of Test</affiliation>
+                </author>
+            </entry>
+        </feed>
+        """,
+        {
+            "level": "error",
+            "event": "Paper http://arxiv.org/abs/1234.5678v1 with invalid metadata: authors.0.name",
+        },
+        {},
+    ),
+    # Malformed date
+    (
+        """
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <title>Test Paper Title</title>
+                <id>http://arxiv.org/abs/1234.5678v1</id>
+                <updated>not-a-date</updated>
+                <summary>This is a test abstract.</summary>
+            </entry>
+        </feed>
+        """,
+        {
+            "level": "error",
+            "event": "Paper http://arxiv.org/abs/1234.5678v1 with invalid metadata: updated",
+        },
+        {},
+    ),
+    # Missing authors
+    (
+        """
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <title>Test Paper Title</title>
+                <id>http://arxiv.org/abs/1234.5678v1</id>
+                <summary>This is a test abstract.</summary>
+            </entry>
+        </feed>
+        """,
+        {},
+        {
+            "id": "1234.5678v1",
+            "url": "http://arxiv.org/abs/1234.5678v1",
+            "pdf_url": "http://arxiv.org/pdf/1234.5678v1",
+            "updated": None,
+            "published": None,
+            "title": "Test Paper Title",
+            "summary": "This is a test abstract.",
+            "authors": [],
+            "comment": "",
+            "n_pages": None,
+            "n_figures": None,
+            "categories": [],
+            "pdf_loader": None,
+            "text": "",
+        },
+    ),
+    # Successful response
+    (
+        """
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <id>http://arxiv.org/abs/1234.5678v1</id>
+                <updated>2024-04-25T00:00:00Z</updated>
+                <published>2024-04-24T00:00:00Z</published>
+                <title>Test Paper Title</title>
+                <summary>This is a test abstract.</summary>
+                <author>
+                    <name>John Doe</name>
+                    <affiliation>University of Test</affiliation>
+                </author>
+                <category term="cond-mat.str-el"/>
+                <arxiv:comment xmlns:arxiv="http://arxiv.org/schemas/atom">10 pages, 2 figures</arxiv:comment>
+            </entry>
+        </feed>
+        """,
+        {},
+        {
+            "id": "1234.5678v1",
+            "url": "http://arxiv.org/abs/1234.5678v1",
+            "pdf_url": "http://arxiv.org/pdf/1234.5678v1",
+            "updated": datetime.datetime(
+                2024, 4, 25, 0, 0, tzinfo=datetime.timezone.utc
+            ),
+            "published": datetime.datetime(
+                2024, 4, 24, 0, 0, tzinfo=datetime.timezone.utc
+            ),
+            "title": "Test Paper Title",
+            "summary": "This is a test abstract.",
+            "authors": [
+                {
+                    "name": "John Doe",
+                    "affiliation": "University of Test",
+                    "email": None,
+                }
+            ],
+            "comment": "10 pages, 2 figures",
+            "n_pages": 10,
+            "n_figures": 2,
+            "categories": ["cond-mat.str-el"],
+            "pdf_loader": None,
+            "text": "",
+        },
+    ),
+]
+FETCH_CASES_IDS = [
+    "empty-response",
+    "error-in-title",
+    "invalid-id",
+    "missing-summary",
+    "author-without-name",
+    "malformed-date",
+    "missing-authors",
+    "successful-response",
+]
+
+# Dedented and encoded once at import, as the `requests` response content is in bytes, and with the expected
+# `ArxivPaper` validated once, so the fetched papers are compared model-to-model
+ENCODED_FETCH_CASES = [
+    (
+        textwrap.dedent(arxiv_response).strip().encode("utf-8"),
+        log_msg,
+        ArxivPaper(**result) if result else None,
+    )
+    for arxiv_response, log_msg, result in FETCH_CASES
+]
+
+
+@pytest.fixture
+def mock_session_get():
+    """Fixture to patch `requests.Session.get`, returning a stub response whose `content` is set in each test."""
+    response = SimpleNamespace(content=b"", raise_for_status=lambda: None)
+    with patch("requests.Session.get", return_value=response) as mock_get:
+        yield mock_get
+
+
+@pytest.fixture
+def arxiv_response(request, mock_session_get: MagicMock) -> bytes:
+    """Indirect fixture returning the pre-encoded arXiv API response, and setting it as the mocked response `content`."""
+    mock_session_get.return_value.content = request.param
+    return request.param
+
 
 class TestArxivFetcher:
     """Tests for the `ArxivFetcher` class."""
@@ -56,9 +264,10 @@ class TestArxivFetcher:
             ("tests/data/fetched_arxiv_ids.txt", "2507.02753v1"),
         ],
     )
-    def test_last_fetched_id(self, fetched_ids_file: str, result: str):
+    def test_last_fetched_id(
+        self, arxiv_fetcher: ArxivFetcher, fetched_ids_file: str, result: str
+    ):
         """Tests the `last_fetched_id` property of the `ArxivFetcher` class."""
-        arxiv_fetcher = ArxivFetcher()
         assert (
             arxiv_fetcher._last_fetched_id(fetched_ids_file=fetched_ids_file) == result
         )
@@ -83,9 +292,10 @@ class TestArxivFetcher:
             ("pages: 10, figures: 2", (None, None)),
         ],
     )
-    def test_get_pages_and_figures(self, comment, result):
+    def test_get_pages_and_figures(
+        self, arxiv_fetcher: ArxivFetcher, comment: str, result: tuple
+    ):
         """Tests the `_get_pages_and_figures` method of the `ArxivFetcher` class."""
-        arxiv_fetcher = ArxivFetcher()
         assert arxiv_fetcher._get_pages_and_figures(comment) == result
 
     @pytest.mark.parametrize(
@@ -107,163 +317,101 @@ class TestArxivFetcher:
             ("2201.00002v1", "1909.00002", True),
         ],
     )
-    def test_is_newer_than(self, paper_id: str, reference_id: str, result: bool):
+    def test_is_newer_than(
+        self,
+        arxiv_fetcher: ArxivFetcher,
+        paper_id: str,
+        reference_id: str,
+        result: bool,
+    ):
         """Tests the `is_newer_than` method of the `ArxivFetcher` class."""
-        arxiv_fetcher = ArxivFetcher()
         assert arxiv_fetcher.is_newer_than(paper_id, reference_id) == result
 
     @pytest.mark.parametrize(
         "arxiv_response, log_msg, result",
-        [
-            # Empty response
-            (
-                """
-                <feed xmlns="http://www.w3.org/2005/Atom"></feed>
-                """,
-                {"level": "info", "event": "No papers found in the response"},
-                {},
-            ),
-            # Error in title when fetching
-            (
-                """
-                <feed xmlns="http://www.w3.org/2005/Atom">
-                    <entry>
-                        <title>Error when fetching the paper</title>
-                    </entry>
-                </feed>
-                """,
-                {"level": "error", "event": "Error fetching the paper"},
-                {},
-            ),
-            # Id not in the correct format
-            (
-                """
-                <feed xmlns="http://www.w3.org/2005/Atom">
-                    <entry>
-                        <title>Test Paper Title</title>
-                        <id>not a proper arxiv id</id>
-                    </entry>
-                </feed>
-                """,
-                {
-                    "level": "error",
-                    "event": "Paper without a valid URL id: not a proper arxiv id",
-                },
-                {},
-            ),
-            # Missing summary
-            (
-                """
-                <feed xmlns="http://www.w3.org/2005/Atom">
-                    <entry>
-                        <title>Test Paper Title</title>
-                        <id>http://arxiv.org/abs/1234.5678v1</id>
-                    </entry>
-                </feed>
-                """,
-                {
-                    "level": "error",
-                    "event": "Paper http://arxiv.org/abs/1234.5678v1 without summary/abstract",
-                },
-                {},
-            ),
-            # Missing authors
-            (
-                """
-                <feed xmlns="http://www.w3.org/2005/Atom">
-                    <entry>
-                        <title>Test Paper Title</title>
-                        <id>http://arxiv.org/abs/1234.5678v1</id>
-                        <summary>This is a test abstract.</summary>
-                    </entry>
-                </feed>
-                """,
-                {},
-                {
-                    "id": "1234.5678v1",
-                    "url": "http://arxiv.org/abs/1234.5678v1",
-                    "pdf_url": "http://arxiv.org/pdf/1234.5678v1",
-                    "updated": None,
-                    "published": None,
-                    "title": "Test Paper Title",
-                    "summary": "This is a test abstract.",
-                    "authors": [],
-                    "comment": "",
-                    "n_pages": None,
-                    "n_figures": None,
-                    "categories": [],
-                    "pdf_loader": None,
-                    "text": "",
-                },
-            ),
-            # Successful response
-            (
-                """
-                <feed xmlns="http://www.w3.org/2005/Atom">
-                    <entry>
-                        <id>http://arxiv.org/abs/1234.5678v1</id>
-                        <updated>2024-04-25T00:00:00Z</updated>
-                        <published>2024-04-24T00:00:00Z</published>
-                        <title>Test Paper Title</title>
-                        <summary>This is a test abstract.</summary>
-                        <author>
-                            <name>John Doe</name>
-                            <affiliation>University of Test</affiliation>
-                        </author>
-                        <category term="cond-mat.str-el"/>
-                        <arxiv:comment xmlns:arxiv="http://arxiv.org/schemas/atom">10 pages, 2 figures</arxiv:comment>
-                    </entry>
-                </feed>
-                """,
-                {},
-                {
-                    "id": "1234.5678v1",
-                    "url": "http://arxiv.org/abs/1234.5678v1",
-                    "pdf_url": "http://arxiv.org/pdf/1234.5678v1",
-                    "updated": datetime.datetime(
-                        2024, 4, 25, 0, 0, tzinfo=datetime.timezone.utc
-                    ),
-                    "published": datetime.datetime(
-                        2024, 4, 24, 0, 0, tzinfo=datetime.timezone.utc
-                    ),
-                    "title": "Test Paper Title",
-                    "summary": "This is a test abstract.",
-                    "authors": [
-                        {
-                            "name": "John Doe",
-                            "affiliation": "University of Test",
-                            "email": None,
-                        }
-                    ],
-                    "comment": "10 pages, 2 figures",
-                    "n_pages": 10,
-                    "n_figures": 2,
-                    "categories": ["cond-mat.str-el"],
-                    "pdf_loader": None,
-                    "text": "",
-                },
-            ),
-        ],
+        ENCODED_FETCH_CASES,
+        ids=FETCH_CASES_IDS,
+        indirect=["arxiv_response"],
     )
-    @patch("urllib.request.urlopen")
     def test_fetch(
         self,
-        mock_urlopen: MagicMock,
+        arxiv_fetcher: ArxivFetcher,
         cleared_log_storage: list,
-        arxiv_response: str,
+        arxiv_response: bytes,
         log_msg: dict,
-        result: dict,
+        result: ArxivPaper | None,
     ):
         """Tests the `fetch` method of the `ArxivFetcher` class."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = arxiv_response.encode("utf-8")
-        mock_urlopen.return_value = mock_response
-
-        fetcher = ArxivFetcher(max_results=1, download_path=Path("tests/data"))
-        papers = fetcher.fetch(n_papers=1, write=False)
+        arxiv_fetcher.max_results = 1
+        papers = arxiv_fetcher.fetch(n_papers=1, write=False)
         if log_msg:
             assert len(cleared_log_storage) in [1, 2]
             assert cleared_log_storage[0]["level"] == log_msg["level"]
             assert cleared_log_storage[0]["event"] == log_msg["event"]
-        if papers and all(isinstance(p, ArxivPaper) for p in papers):
-            assert papers[0].model_dump() == result
+        if papers:
+            assert papers[0] == result
+
+    def test_fetch_start_index(
+        self, mock_session_get: MagicMock, arxiv_fetcher: ArxivFetcher
+    ):
+        """Tests that `fetch` advances `start_index` by the number of returned entries and stops at the end of the feed."""
+        entries = "".join(
+            f"""
+            <entry>
+                <id>http://arxiv.org/abs/1234.567{i}v1</id>
+                <title>Test Paper Title {i}</title>
+                <summary>This is a test abstract.</summary>
+            </entry>
+            """
+            for i in range(3)
+        )
+        mock_session_get.return_value.content = (
+            f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode()
+        )
+
+        arxiv_fetcher.max_results = 5
+        papers = arxiv_fetcher.fetch(n_papers=10)
+        assert [paper.id for paper in papers] == [
+            "1234.5670v1",
+            "1234.5671v1",
+            "1234.5672v1",
+        ]
+        assert arxiv_fetcher.start_index == 3
+        # less entries than requested, so no other batch is requested
+        assert mock_session_get.call_count == 1
+        # the last fetched ID is stored in the temporary `fetched_arxiv_ids.txt`
+        assert arxiv_fetcher.fetched_ids_file.read_text() == "1234.5672v1"
+
+    def test_fetch_empty_next_batch(
+        self, mock_session_get: MagicMock, arxiv_fetcher: ArxivFetcher
+    ):
+        """Tests that `fetch` keeps the papers of the previous batches when the next batch is an empty feed."""
+        entries = "".join(
+            f"""
+            <entry>
+                <id>http://arxiv.org/abs/1234.567{i}v1</id>
+                <title>Test Paper Title {i}</title>
+                {"" if i == 1 else "<summary>This is a test abstract.</summary>"}
+            </entry>
+            """
+            for i in range(3)
+        )
+        mock_session_get.side_effect = [
+            # full batch with a paper without summary, so another batch is requested
+            SimpleNamespace(
+                content=f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode(),
+                raise_for_status=lambda: None,
+            ),
+            # end of the feed
+            SimpleNamespace(
+                content=b'<feed xmlns="http://www.w3.org/2005/Atom"></feed>',
+                raise_for_status=lambda: None,
+            ),
+        ]
+
+        arxiv_fetcher.max_results = 3
+        papers = arxiv_fetcher.fetch(n_papers=10)
+        assert [paper.id for paper in papers] == ["1234.5670v1", "1234.5672v1"]
+        assert arxiv_fetcher.start_index == 3
+        assert mock_session_get.call_count == 2
+        assert arxiv_fetcher.fetched_ids_file.read_text() == "1234.5672v1"